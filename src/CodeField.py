@@ -23,6 +23,130 @@ limitations under the License.
 
 # ---- // Imports
 import flet
+import collections
+import itertools
+import threading
+import types
+
+# numba is optional. when available, newline counting on very large buffers is
+# JIT-compiled to a vectorized byte scan; otherwise str.count is used
+try:
+    import numpy
+    from numba import njit
+
+    @njit(cache = True)
+    def _count_newlines_jit(buffer):
+        count = 0
+
+        for index in range(buffer.size):
+            if buffer[index] == 10:
+                count += 1
+
+        return count
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# ---- // Helpers
+def _fnv1a(text: str) -> int:
+    """
+    Hash a string with the 32-bit FNV-1a algorithm.
+
+    Params:
+        text: str -> The string to hash.
+
+    Returns:
+        int -> The 32-bit hash of the string.
+    """
+    hashValue = 0x811C9DC5
+
+    for char in text:
+        hashValue ^= ord(char)
+        hashValue = (hashValue + (hashValue << 1) + (hashValue << 4) + (hashValue << 7) + (hashValue << 8) + (hashValue << 24)) & 0xFFFFFFFF
+
+    return hashValue
+
+def _count_newlines(text: str) -> int:
+    """
+    Count the newlines in a string.
+
+    Uses the numba JIT scan for large buffers when numba is installed, since the
+    compiled loop vectorizes. Below the threshold (or without numba) the dispatch
+    overhead isn't worth it, so str.count's C-level scan is used instead.
+
+    Params:
+        text: str -> The string to count newlines in.
+
+    Returns:
+        int -> The amount of newlines in the string.
+    """
+    if _HAS_NUMBA and len(text) > 64_000:
+        return int(_count_newlines_jit(numpy.frombuffer(text.encode(), dtype = numpy.uint8)))
+
+    return text.count("\n")
+
+def _escape_char(char: str) -> str:
+    """
+    Escape a single character for embedding in a markdown code block.
+
+    Params:
+        char: str -> The character to escape.
+
+    Returns:
+        str -> The escaped character.
+    """
+    return "\\`" if char == "`" else char
+
+# ---- // Constants
+# shared style for line number texts. height = 0 is important! prevents inaccuracy
+_LINE_NUMBER_STYLE = flet.TextStyle(height = 0)
+
+# closing fence of a markdown code block. the opening fence depends on the language
+# so it is cached per instance instead
+_FENCE_CLOSE = "\n```"
+
+# default shift mapping (UK layout), shared read-only between instances instead of
+# being rebuilt per CodeField. the precompiled translate table is shared too
+_DEFAULT_SHIFT_MAPPING = types.MappingProxyType({
+    "1": "!",
+    "2": "\"",
+    "3": "£",
+    "4": "$",
+    "5": "%",
+    "6": "^",
+    "7": "&",
+    "8": "*",
+    "9": "(",
+    "0": ")",
+    "-" : "_",
+    "=" : "+",
+
+    "[" : "{",
+    "]" : "}",
+    ";" : ":",
+    "'" : "@",
+    "#" : "~",
+    "," : "<",
+    "." : ">",
+    "/" : "?",
+    "`" : "¬",
+    "\\" : "|",
+})
+
+_DEFAULT_SHIFT_TRANS = str.maketrans(dict(_DEFAULT_SHIFT_MAPPING))
+
+# special key names mapped straight to the character they produce. covers the keypad
+# variants too, so no startswith/replace stripping is needed per keystroke
+_SPECIAL_KEYS = {
+    "Decimal" : ".",
+    "Add" : "+",
+    "Subtract" : "-",
+    "Divide" : "/",
+    "Multiply" : "*",
+    "Num Lock" : "",
+    **{f"Numpad {number}": str(number) for number in range(10)},
+}
 
 # ---- // Main
 class CodeField(flet.Container):
@@ -54,6 +178,10 @@ class CodeField(flet.Container):
         on_focus: function(focused: bool) -> Called when the code field is clicked.
         on_change: function() -> Called when the user types.
     """
+    # how many lines above and below the type_point get syntax highlighting. text
+    # outside the window is shown as plain text so huge files stay responsive
+    _RENDER_WINDOW = 200
+
     def __init__(self, text: str = "print('hello world')", bgcolor: str = None, code_theme: str = "obsidian", show_language_text: bool = True, language_text_color: str = flet.colors.GREY, show_line_numbers: bool = True, line_number_text_color: str = flet.colors.WHITE, allow_pasting: bool = True, show_focus_border: bool = True, focus_border_color: str = flet.colors.BLUE_400, tab_spacing: int = 4, font_size: int = 10, font: str = "Roboto Mono", letter_spacing: int|float = 0, language: str = "python", custom_shift_mapping: dict[str, str] = None, on_focus: "function" = None, on_change: "function" = None):
         # // attributes
         self.text = text
@@ -79,35 +207,38 @@ class CodeField(flet.Container):
         if on_change is not None:
             self.on_change = on_change
 
+        # compile the shift mapping into a translate table so applying it is a single C
+        # call. the default mapping and its table are shared module-level constants
         if self.custom_shift_mapping is None:
-            self.custom_shift_mapping = {
-                "1": "!",
-                "2": "\"",
-                "3": "£",
-                "4": "$",
-                "5": "%",
-                "6": "^",
-                "7": "&",
-                "8": "*",
-                "9": "(",
-                "0": ")",
-                "-" : "_",
-                "=" : "+",
-                
-                "[" : "{",
-                "]" : "}",
-                ";" : ":",
-                "'" : "@",
-                "#" : "~",
-                "," : "<",
-                "." : ">",
-                "/" : "?",
-                "`" : "¬",
-                "\\" : "|",
-            }
-        
+            self.custom_shift_mapping = _DEFAULT_SHIFT_MAPPING
+            self._shift_trans = _DEFAULT_SHIFT_TRANS
+        else:
+            self._shift_trans = str.maketrans(self.custom_shift_mapping)
+
+        # dispatch table for keyboard input. keys not in here get parsed and inserted
+        self._key_handlers = {
+            "Backspace" : self._handle_backspace,
+            "Escape" : self._handle_escape,
+            "Caps Lock" : self._handle_caps_lock,
+            "Arrow Left" : self._handle_arrow_left,
+            "Arrow Right" : self._handle_arrow_right,
+            "Arrow Up" : self._handle_arrow_up,
+            "Arrow Down" : self._handle_arrow_down,
+            "Tab" : self._handle_tab,
+            "V" : self._handle_paste,
+        }
+
         self.is_caps = False
         self.mounted = False
+        self._md_cache: collections.OrderedDict[int, str] = collections.OrderedDict()
+        self._md_cache_size = 64
+        self._prev_line_count = 0
+        self._update_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._cached_text_style = None
+        self._style_key = None
+        self._fence_open = None
+        self._fence_language = None
         self.focused = False
         self.type_point = len(self.text)
         
@@ -148,9 +279,17 @@ class CodeField(flet.Container):
             extension_set = flet.MarkdownExtensionSet.COMMON_MARK,
             expand = True
         )
-        
+
+        # plain text shown above/below the highlighted window for large files
+        self.code_markdown_pre = flet.Text(visible = False)
+        self.code_markdown_post = flet.Text(visible = False)
+
         self.code_markdown_container = flet.Container(
-            content = self.code_markdown,
+            content = flet.Column(
+                controls = [self.code_markdown_pre, self.code_markdown, self.code_markdown_post],
+                spacing = 0,
+                expand = True
+            ),
             on_click = self.on_container_click
         )
         
@@ -158,7 +297,35 @@ class CodeField(flet.Container):
 
         # init
         super().__init__(content = self.root)
-        
+
+    # // Properties
+    @property
+    def text(self) -> str:
+        """
+        The full text of the code field.
+
+        The text is stored internally as a gap buffer (two character stacks split at
+        the type_point) so insertions and removals at the cursor are O(1). The joined
+        string is memoized and only rebuilt after a mutation.
+
+        Returns:
+            str -> The full text.
+        """
+        if self._text_cache is None:
+            # one join over both halves, rather than joining each half and concatenating
+            self._text_cache = "".join(itertools.chain(self._left, reversed(self._right)))
+
+        return self._text_cache
+
+    @text.setter
+    def text(self, value: str):
+        self._left = list(value)
+        self._right = []
+        self._left_escaped = [_escape_char(char) for char in value]
+        self._right_escaped = []
+        self._text_cache = value
+        self.type_point = len(value)
+
     # // Helper Methods
     def _construct_markdown_text_style(self) -> flet.TextStyle:
         """
@@ -167,36 +334,167 @@ class CodeField(flet.Container):
         Returns:
             flet.TextStyle -> The constructed TextStyle object.
         """
-        return flet.TextStyle(
-            font_family = self.font,
-            size = self.font_size,
-            letter_spacing = self.letter_spacing,
-            bgcolor = self.code_bgcolor
-        )
+        # reuse the cached style unless one of its inputs changed
+        styleKey = (self.font, self.font_size, self.letter_spacing, self.code_bgcolor)
+
+        if styleKey != self._style_key:
+            self._style_key = styleKey
+            self._cached_text_style = flet.TextStyle(
+                font_family = self.font,
+                size = self.font_size,
+                letter_spacing = self.letter_spacing,
+                bgcolor = self.code_bgcolor
+            )
+
+        return self._cached_text_style
         
     def _code(self, text: str):
         """
-        Surrounds text in a code block.
-        
+        Surrounds already-escaped text in a code block.
+
         Params:
-            text: str -> The text to surround.
-            
+            text: str -> The text to surround. Backticks must already be escaped.
+
         Returns:
             str -> The text surrounded in a code block.
         """
-        filtered = text.replace("`", "\\`")
-        return f"```{self.language}\n{filtered}\n```"
+        # check the cache first. the key covers both the text and the language so
+        # a language change never serves a stale code block
+        cacheKey = _fnv1a(text) ^ _fnv1a(self.language)
+        cached = self._md_cache.get(cacheKey)
+
+        if cached is not None:
+            self._md_cache.move_to_end(cacheKey)
+            return cached
+
+        # rebuild the opening fence only when the language changes
+        if self._fence_language != self.language:
+            self._fence_language = self.language
+            self._fence_open = f"```{self.language}\n"
+
+        # build the code block and cache it
+        result = self._fence_open + text + _FENCE_CLOSE
+
+        self._md_cache[cacheKey] = result
+
+        if len(self._md_cache) > self._md_cache_size:
+            self._md_cache.popitem(last = False)
+
+        return result
     
+    def _window_bounds(self) -> tuple[int, int]:
+        """
+        Find the bounds of the lines around the type_point that should be syntax
+        highlighted. Text outside the bounds is shown as plain text, so highlighting
+        cost scales with the window size rather than the document size.
+
+        Returns:
+            tuple[int, int] -> The start and end offsets of the window in the text.
+        """
+        text = self.text
+
+        # walk backwards over up to _RENDER_WINDOW newlines to find the window start
+        start = self.type_point
+
+        for _ in range(self._RENDER_WINDOW):
+            newlineLocation = text.rfind("\n", 0, start)
+
+            if newlineLocation == -1:
+                start = 0
+                break
+
+            start = newlineLocation
+        else:
+            start += 1
+
+        # walk forwards likewise to find the window end
+        end = self.type_point
+
+        for _ in range(self._RENDER_WINDOW):
+            newlineLocation = text.find("\n", end)
+
+            if newlineLocation == -1:
+                end = len(text)
+                break
+
+            end = newlineLocation + 1
+        else:
+            end -= 1
+
+        return start, end
+
+    def _escaped_window(self, start: int, end: int) -> str:
+        """
+        Join the escaped form of the characters between two offsets. The escaped
+        characters are maintained incrementally alongside the gap buffer, so no
+        str.replace pass over the window is needed.
+
+        Params:
+            start: int -> The start offset of the window in the text.
+            end: int -> The end offset of the window in the text.
+
+        Returns:
+            str -> The escaped text between the two offsets.
+        """
+        leftLength = len(self._left_escaped)
+        parts = self._left_escaped[start:min(end, leftLength)]
+
+        if end > leftLength:
+            # the right stack is stored reversed, so map the offsets and flip the slice
+            rightLength = len(self._right_escaped)
+            low = rightLength - (end - leftLength)
+            high = rightLength - max(start - leftLength, 0)
+
+            parts += self._right_escaped[low:high][::-1]
+
+        return "".join(parts)
+
+    def _mark_dirty(self):
+        """
+        Schedule a control update on a short timer. Mutations landing within the same
+        frame (~16ms) are coalesced into one flush, so burst typing and pastes render
+        once per frame instead of once per character.
+        """
+        with self._update_lock:
+            if self._flush_scheduled:
+                return
+
+            self._flush_scheduled = True
+
+        threading.Timer(0.016, self._flush).start()
+
+    def _flush(self):
+        """
+        Apply the control update scheduled by _mark_dirty.
+        """
+        with self._update_lock:
+            self._flush_scheduled = False
+
+        if not self.mounted:
+            return
+
+        self._update_controls()
+
     def _update_controls(self):
         """
         Set the markdown control value to self.text and update the control.
         """
-        # update code markdown
-        self.code_markdown.value = self._code(self.text if self.text != "" else " ") # prevent 0 width
+        # update code markdown. only the window around the type_point is highlighted
+        start, end = self._window_bounds()
+        text = self.text
+        preText, postText = text[:start], text[end:]
+        windowText = self._escaped_window(start, end)
+
+        self.code_markdown.value = self._code(windowText if windowText != "" else " ") # prevent 0 width
         self.code_markdown.code_theme = self.code_theme
         self.code_markdown.code_style = self._construct_markdown_text_style()
 
-        self.code_markdown.update()
+        # update the plain text surrounding the highlighted window
+        for control, value in ((self.code_markdown_pre, preText), (self.code_markdown_post, postText)):
+            control.value = value.strip("\n")
+            control.visible = value != ""
+            control.font_family = self.font
+            control.size = self.font_size
         
         # update language text
         if self.show_language_text:
@@ -204,23 +502,28 @@ class CodeField(flet.Container):
             self.language_text.font_family = self.font
             self.language_text.size = self.font_size
             self.language_text.color = self.language_text_color
-            
-            self.language_text.update()
         
-        # update line numbers
+        # update line numbers. only the delta between the old and new line count
+        # is applied so typing a character doesn't rebuild every line number text
         if self.show_line_numbers:
-            lineCount = len(self.text.split("\n")) + 1
-            
-            self.line_numbers.controls = [flet.Text(
-                value = line,
-                size = self.font_size,
-                font_family = self.font,
-                color = self.line_number_text_color,
-                bgcolor = flet.colors.TRANSPARENT,
-                style = flet.TextStyle(height = 0) # important! prevents inaccuracy
-            ) for line in range(1, lineCount)]
-            
-            self.line_numbers.update()
+            lineCount = _count_newlines(self.text) + 2
+
+            if lineCount > self._prev_line_count:
+                self.line_numbers.controls.extend(flet.Text(
+                    value = line,
+                    size = self.font_size,
+                    font_family = self.font,
+                    color = self.line_number_text_color,
+                    bgcolor = flet.colors.TRANSPARENT,
+                    style = _LINE_NUMBER_STYLE
+                ) for line in range(max(1, self._prev_line_count), lineCount))
+            elif lineCount < self._prev_line_count:
+                del self.line_numbers.controls[lineCount - 1:]
+
+            self._prev_line_count = lineCount
+
+        # flush everything in one round-trip to the Flet client
+        self.root.update()
 
     def _parse_letter(self, letter: str, isShift: bool):
         """
@@ -233,39 +536,31 @@ class CodeField(flet.Container):
         # handle enter
         if letter == "Enter":
             letter = "\n"
-    
+
+        # handle keypad and other special keys. checked before the shift mapping so
+        # the translate table never touches multi-character key names
+        mapped = _SPECIAL_KEYS.get(letter)
+
+        if mapped is not None:
+            return mapped
+
         # handle secondary keys
         if isShift:
-            if letter in self.custom_shift_mapping:
-                letter = self.custom_shift_mapping[letter]
-                
-        # handle keypad
-        if letter.startswith("Numpad" ):
-            letter = letter.replace("Numpad ", "")
-            
-        if letter == "Decimal":
-            return "."
-        
-        if letter == "Add":
-            return "+"
-        
-        if letter == "Subtract":
-            return "-"
-        
-        if letter == "Divide":
-            return "/"
-        
-        if letter == "Multiply":
-            return "*"
-        
-        if letter == "Num Lock":
-            return ""
-        
+            letter = letter.translate(self._shift_trans)
+
         if len(letter) > 1:
             return ""
-            
-        # return
-        return letter.upper() if self.is_caps or isShift else letter.lower()
+
+        # return, case-folding ASCII letters with a bit flip instead of upper()/lower()
+        wantUpper = self.is_caps or isShift
+
+        if wantUpper and "a" <= letter <= "z":
+            return chr(ord(letter) ^ 0x20)
+
+        if not wantUpper and "A" <= letter <= "Z":
+            return chr(ord(letter) ^ 0x20)
+
+        return letter
     
     # // Public Methods
     def set_focus(self, focus: bool):
@@ -281,36 +576,55 @@ class CodeField(flet.Container):
         # fire event
         self.on_focus(focus)
 
-        # visual representation of focus
-        self.code_markdown_container.border = flet.border.all(1, self.focus_border_color) if focus and self.show_focus_border else None
-        self.code_markdown_container.update()
+        # visual representation of focus. skip the round-trip if the border is unchanged
+        border = flet.border.all(1, self.focus_border_color) if focus and self.show_focus_border else None
+
+        if border != self.code_markdown_container.border:
+            self.code_markdown_container.border = border
+            self.code_markdown_container.update()
         
     def set_type_point(self, to: int):
         """
         Set self.type_point.
-        
+
         Params:
             to: int -> The point to set self.type_point to.
         """
-        self.type_point = max(0, min(len(self.text), to))
-        
+        to = max(0, min(len(self._left) + len(self._right), to))
+
+        if to == self.type_point:
+            return
+
+        # move the gap so the split between the two stacks sits at the new point
+        while len(self._left) > to:
+            self._right.append(self._left.pop())
+            self._right_escaped.append(self._left_escaped.pop())
+
+        while len(self._left) < to:
+            self._left.append(self._right.pop())
+            self._left_escaped.append(self._right_escaped.pop())
+
+        self.type_point = to
+
     def insert_letter(self, letter: str):
         """
         Insert a letter into the text.
-        
+
         Params:
             letter: str -> The letter to insert.
         """
         if letter == "":
             return
-        
+
         if len(letter) > 1:
             return
-        
-        self.text = self.text[:self.type_point] + letter + self.text[self.type_point:]
-        self.set_type_point(self.type_point + 1)
-        self._update_controls()
-        
+
+        self._left.append(letter)
+        self._left_escaped.append(_escape_char(letter))
+        self._text_cache = None
+        self.type_point += 1
+        self._mark_dirty()
+
         self.on_change()
         
     def insert_word(self, word: str):
@@ -320,36 +634,50 @@ class CodeField(flet.Container):
         Params:
             word: str -> The word to insert.
         """
-        for letter in word:
-            self.insert_letter(letter)
+        if word == "":
+            return
+
+        # insert the whole word in one go so a paste triggers one update, not one per letter
+        self._left.extend(word)
+        self._left_escaped.extend(_escape_char(char) for char in word)
+        self._text_cache = None
+        self.type_point += len(word)
+        self._mark_dirty()
+
+        self.on_change()
         
     def remove_letter(self):
         """
         Remove the letter before the type_point from the text.
         """
-        self.text = self.text[:self.type_point - 1] + self.text[self.type_point:]
-        self.set_type_point(self.type_point - 1)
-        self._update_controls()
-        
+        if not self._left:
+            return
+
+        self._left.pop()
+        self._left_escaped.pop()
+        self._text_cache = None
+        self.type_point -= 1
+        self._mark_dirty()
+
         self.on_change()
-        
+
     def get_text_up_to_point(self):
         """
         Returns the text up to the type_point.
-        
+
         Returns:
             str -> The text up to the type_point.
         """
-        return self.text[:self.type_point]
-    
+        return "".join(self._left)
+
     def get_text_after_point(self):
         """
         Returns the text after the type_point.
-        
+
         Returns:
             str -> The text after the type_point.
         """
-        return self.text[self.type_point:]
+        return "".join(reversed(self._right))
 
     # ---- // Control Events
     def on_focus(self, focus: bool):
@@ -367,6 +695,83 @@ class CodeField(flet.Container):
         """
         pass
 
+    # ---- // Keyboard Handlers
+    def _handle_backspace(self, event: flet.KeyboardEvent):
+        if not event.ctrl:
+            # regular backspace
+            self.remove_letter()
+            return
+
+        # remove word in one splice instead of one remove_letter per character
+        locationOfSpace = self.text.rfind(" ", 0, self.type_point)
+        start = locationOfSpace if locationOfSpace != -1 else 0
+
+        if start == self.type_point:
+            return
+
+        del self._left[start:]
+        del self._left_escaped[start:]
+        self._text_cache = None
+        self.type_point = start
+        self._mark_dirty()
+
+        self.on_change()
+
+    def _handle_escape(self, event: flet.KeyboardEvent):
+        # lose focus
+        self.set_focus(False)
+
+    def _handle_caps_lock(self, event: flet.KeyboardEvent):
+        self.is_caps = not self.is_caps
+
+    def _handle_arrow_left(self, event: flet.KeyboardEvent):
+        # move type_point left
+        if event.ctrl:
+            spaceLocation = self.text.rfind(" ", 0, self.type_point)
+
+            self.set_type_point(spaceLocation if spaceLocation != -1 else 0)
+        else:
+            self.set_type_point(self.type_point - 1)
+
+    def _handle_arrow_right(self, event: flet.KeyboardEvent):
+        # move type_point right
+        if event.ctrl:
+            spaceLocation = self.text.find(" ", self.type_point + 1)
+
+            self.set_type_point(spaceLocation if spaceLocation != -1 else len(self.text))
+        else:
+            self.set_type_point(self.type_point + 1)
+
+    def _handle_arrow_up(self, event: flet.KeyboardEvent):
+        # move type_point up
+        locationOfNewline = self.text.rfind("\n", 0, self.type_point)
+        self.set_type_point(locationOfNewline if locationOfNewline != -1 else self.type_point)
+
+    def _handle_arrow_down(self, event: flet.KeyboardEvent):
+        # move type_point down
+        locationOfNewline = self.text.find("\n", self.type_point + 1)
+        self.set_type_point(locationOfNewline if locationOfNewline != -1 else len(self.text))
+
+    def _handle_tab(self, event: flet.KeyboardEvent):
+        self.insert_word(" " * self.tab_spacing)
+
+    def _handle_paste(self, event: flet.KeyboardEvent):
+        if event.ctrl:
+            # handle pasting
+            self.insert_word(self.page.get_clipboard(2))
+        else:
+            self._insert_from_event(event)
+
+    def _insert_from_event(self, event: flet.KeyboardEvent):
+        # parse letter
+        letter = self._parse_letter(event.key, event.shift)
+
+        if letter == "":
+            return
+
+        # update text input, considering self.type_point
+        self.insert_letter(letter)
+
     # ---- // Flet Events
     def before_update(self):
         if not self.mounted:
@@ -395,90 +800,14 @@ class CodeField(flet.Container):
         # if not listening for keyboard input, do nothing
         if not self.focused:
             return
-        
-        # get key
-        letter = event.key
 
-        # handle backspace
-        if letter == "Backspace":
-            if not event.ctrl:
-                # regular backspace
-                self.remove_letter()
-            else:
-                # remove word
-                locationOfSpace = self.get_text_up_to_point().rfind(" ")
+        # dispatch to the handler for this key, else parse and insert it
+        handler = self._key_handlers.get(event.key)
 
-                for _ in range(self.type_point, locationOfSpace if locationOfSpace != -1 else 0, -1):
-                    self.remove_letter()
+        if handler is not None:
+            return handler(event)
 
-            return
-
-        # lose focus if escape is pressed
-        if letter == "Escape":
-            self.set_focus(False)
-            return
-        
-        # set caps lock
-        if letter == "Caps Lock":
-            self.is_caps = not self.is_caps
-            return
-        
-        # move type_point left
-        if letter == "Arrow Left":
-            if event.ctrl:
-                textBeforePoint = self.get_text_up_to_point()
-                spaceLocation = textBeforePoint.rfind(" ")
-                
-                self.set_type_point(spaceLocation if spaceLocation != -1 else 0)
-            else:
-                self.set_type_point(self.type_point - 1)
-            
-            return
-        
-        if letter == "Tab":
-            self.insert_word(" " * self.tab_spacing)
-            
-        # move type_point right
-        if letter == "Arrow Right":
-            if event.ctrl:
-                charactersBeforePoint = len(self.get_text_up_to_point())
-                textAfterPoint = self.get_text_after_point()
-                spaceLocation = textAfterPoint.find(" ")
-
-                self.set_type_point(charactersBeforePoint + (self.type_point + spaceLocation if spaceLocation != -1 else len(textAfterPoint)))
-            else:
-                self.set_type_point(self.type_point + 1)
-                
-            return
-            
-        # move type_point up
-        if letter == "Arrow Up":
-            locationOfNewline = self.get_text_up_to_point().rfind("\n")
-            self.set_type_point(locationOfNewline if locationOfNewline != -1 else self.type_point)
-
-            return
-        
-        # move type_point down
-        if letter == "Arrow Down":
-            charactersBeforePoint = len(self.get_text_up_to_point())
-            locationOfNewline = self.get_text_after_point().find("\n")
-            self.set_type_point(charactersBeforePoint + (self.type_point + locationOfNewline if locationOfNewline != -1 else len(self.get_text_after_point())))
-
-            return
-        
-        # handle pasting
-        if event.ctrl and letter == "V":
-            self.insert_word(self.page.get_clipboard(2))
-            return
-        
-        # parse letter
-        letter = self._parse_letter(letter, event.shift)
-        
-        if letter == "":
-            return
-        
-        # update text input, considering self.type_point
-        self.insert_letter(letter)
+        self._insert_from_event(event)
         
 # ---- // Preview
 if __name__ == "__main__":